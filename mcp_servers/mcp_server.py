@@ -27,8 +27,9 @@ Example:
 Tools provided:
 - fetch_questions: Get questions from the sheet
 - save_response: Save a response (finds next available column)
+- save_responses_batch: Save several responses in a single write
 - get_all_responses: Retrieve all responses from the sheet
-- clear_session_responses: Clear a specific session's responses
+- clear_session_responses: Clear one or more sessions' responses
 - update_sheet_id: Change to a different sheet
 
 Setup:
@@ -41,10 +42,21 @@ Setup:
 from fastmcp import FastMCP
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import atexit
+import inspect
+import google_auth_httplib2
+import httplib2
 import os
-from typing import List, Dict, Optional
-import json
+import random
+import threading
+import time
+from typing import List, Dict, Optional, Tuple, Union
 from dotenv import load_dotenv
+import orjson
 
 # Load environment variables from .env file
 load_dotenv()
@@ -54,36 +66,221 @@ mcp = FastMCP("Feedback Survey MCP Server")
 # Configuration
 GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID", "")
 CREDENTIALS_FILE = os.getenv("GOOGLE_CREDENTIALS_FILE", "credentials.json")
+CREDENTIALS_JSON = os.getenv("GOOGLE_CREDENTIALS_JSON", "")
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# Retry policy for transient Sheets API failures (rate limits and server errors)
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+# Network failures that are worth another attempt (dropped connections, socket
+# timeouts, DNS hiccups); every request this server sends is safe to repeat
+RETRYABLE_ERRORS = (ConnectionError, TimeoutError, httplib2.ServerNotFoundError)
+
+# Socket timeout (seconds) for Sheets API connections
+HTTP_TIMEOUT = float(os.getenv("SHEETS_HTTP_TIMEOUT", "30"))
+
 # Global service instance
 sheets_service = None
-
-# Session tracking - maps sheet_name to current session column
-current_sessions = {}
+_values_resource = None
+_credentials = None
+_service_lock = threading.Lock()
+
+# Bounded pool that runs blocking Sheets requests off the event loop, and the
+# per-thread authorized Http objects they use (httplib2 is not thread-safe)
+MAX_WORKERS = int(os.getenv("SHEETS_MAX_WORKERS", "8"))
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="sheets")
+_thread_local = threading.local()
+
+# Session tracking - maps sheet_name to {'col': column index, 'col_letter': column letter}
+# of the current session; question rows come from _question_cache
+current_sessions: Dict[str, Dict] = {}
+
+# Current sessions are saved here on exit and reloaded on start
+SESSION_CACHE_FILE = os.path.expanduser(
+    os.getenv("SESSION_CACHE_FILE", "~/.voicepulse/session_cache.json")
+)
+
+# Per-sheet locks - serialize session changes (start, auto-start, clear) on one tab
+# while other tabs proceed in parallel
+_sheet_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Serializes update_sheet_id so a validate-then-swap can't interleave with another
+_sheet_id_lock = asyncio.Lock()
+
+# Question cache - maps (sheet_id, sheet_name) to {question_number: (row, question_text)}
+_question_cache: Dict[Tuple[str, str], Dict[str, Tuple[int, str]]] = {}
+_question_cache_lock = asyncio.Lock()
+
+# Sheet snapshots - maps (sheet_id, sheet_name) to (fetched_at, used-range values)
+SNAPSHOT_TTL = float(os.getenv("SHEETS_SNAPSHOT_TTL", "5"))
+SNAPSHOT_CACHE_SIZE = 64
+_snapshot_cache: Dict[Tuple[str, str], Tuple[float, list]] = {}
+# Bumped by every invalidation so a read that was in flight across a write can't
+# store its pre-write values
+_snapshot_generations: Dict[Tuple[str, str], int] = {}
+
+# Write batching - saves arriving within FLUSH_MS of each other go out in one batchUpdate
+FLUSH_MS = int(os.getenv("SHEETS_FLUSH_MS", "50"))
+FLUSH_BATCH = int(os.getenv("SHEETS_FLUSH_BATCH", "50"))
+_pending_writes: List[Tuple[str, Tuple[str, int, int, int], str, asyncio.Future]] = []
+_flush_event = asyncio.Event()
+_batch_full_event = asyncio.Event()
+_flush_task: Optional[asyncio.Task] = None
+# Futures of writes not yet flushed, per (sheet_id, sheet_name)
+_unflushed_writes: Dict[Tuple[str, str], set] = defaultdict(set)
+
+# Numeric tab IDs - maps spreadsheet ID to {sheet_name: sheetId}, used to address
+# cells by GridRange instead of A1 notation
+_grid_ids: Dict[str, Dict[str, int]] = {}
+# Tab list reads in flight, per spreadsheet ID, shared by every caller that needs them
+_grid_id_lookups: Dict[str, asyncio.Task] = {}
+
+# Client-side rate limits, kept just under Google's 60 read / 60 write requests
+# per minute per user so bursts queue here instead of earning 429s
+READS_PER_MINUTE = int(os.getenv("SHEETS_READS_PER_MINUTE", "55"))
+WRITES_PER_MINUTE = int(os.getenv("SHEETS_WRITES_PER_MINUTE", "55"))
+
+
+def _authorized_http(creds):
+    """Create a long-lived authorized Http that keeps its connections alive"""
+    return google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+
+
+def _load_credentials():
+    """Load service account credentials from GOOGLE_CREDENTIALS_JSON, or else the credentials file"""
+    if CREDENTIALS_JSON:
+        return Credentials.from_service_account_info(
+            orjson.loads(CREDENTIALS_JSON),
+            scopes=SCOPES
+        )
+    return Credentials.from_service_account_file(
+        CREDENTIALS_FILE,
+        scopes=SCOPES
+    )
 
 
 def get_sheets_service():
     """Initialize and return Google Sheets service"""
-    global sheets_service
+    global sheets_service, _credentials
 
     if sheets_service is not None:
         return sheets_service
 
-    try:
-        creds = Credentials.from_service_account_file(
-            CREDENTIALS_FILE,
-            scopes=SCOPES
-        )
-        sheets_service = build('sheets', 'v4', credentials=creds)
-        return sheets_service
-    except Exception as e:
-        print(f"[ERROR] Failed to initialize Google Sheets service: {e}")
-        raise
+    # Double-checked so concurrent first calls build the service only once
+    with _service_lock:
+        if sheets_service is not None:
+            return sheets_service
+
+        try:
+            # Credentials are parsed once and reused if the service is ever rebuilt
+            if _credentials is None:
+                _credentials = _load_credentials()
+            sheets_service = build(
+                'sheets', 'v4',
+                http=_authorized_http(_credentials),
+                cache_discovery=False,
+                static_discovery=True
+            )
+            return sheets_service
+        except Exception as e:
+            print(f"[ERROR] Failed to initialize Google Sheets service: {e}")
+            raise
+
+
+def _thread_http():
+    """Return the calling thread's authorized Http, creating it on first use"""
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = _authorized_http(_credentials)
+        _thread_local.http = http
+    return http
+
+
+class _TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per `per` seconds, in bursts of up to `rate`"""
+
+    def __init__(self, rate: int, per: float = 60.0):
+        self._capacity = rate
+        self._tokens = float(rate)
+        self._fill_rate = rate / per
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+
+
+_read_limiter = _TokenBucket(READS_PER_MINUTE)
+_write_limiter = _TokenBucket(WRITES_PER_MINUTE)
+
+
+async def _with_backoff(request, *, max_retries=5, base=1.0, cap=30, jitter=0.5):
+    """
+    Execute a Sheets API request, retrying 429/5xx responses and network errors with exponential backoff
 
+    The blocking execute() runs on the bounded _executor pool so the event
+    loop keeps serving other tool calls while the request is in flight.
+    Each attempt first takes a token from the read (GET) or write limiter;
+    a batchUpdate counts as one request however many cells it carries.
 
-def column_number_to_letter(n):
-    """Convert column number to letter (1='A', 2='B', etc.)"""
+    Honors the Retry-After header when Google sends one, otherwise sleeps
+    min(cap, base * 2**attempt) plus up to `jitter` of random extra delay.
+    """
+    limiter = _read_limiter if request.method == 'GET' else _write_limiter
+
+    for attempt in range(max_retries + 1):
+        retry_after = ''
+        await limiter.acquire()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                _executor, lambda: request.execute(http=_thread_http())
+            )
+        except HttpError as e:
+            if e.resp.status not in RETRYABLE_STATUSES or attempt == max_retries:
+                raise
+            retry_after = e.resp.get('retry-after', '')
+            reason = f"returned {e.resp.status}"
+        except RETRYABLE_ERRORS as e:
+            if attempt == max_retries:
+                raise
+            reason = f"failed ({type(e).__name__}: {e})"
+
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = min(cap, base * 2 ** attempt) * (1 + random.uniform(0, jitter))
+
+        print(f"[WARNING] Sheets API request {reason}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+
+def _sheet_values():
+    """Return the spreadsheets.values() resource, built once and reused by every call"""
+    global _values_resource
+
+    if _values_resource is None:
+        _values_resource = get_sheets_service().spreadsheets().values()
+    return _values_resource
+
+
+def _a1_range(sheet_name: str, cells: str = "") -> str:
+    """
+    Build an A1 range, quoting the sheet name so tabs with spaces or quotes resolve
+
+    Without cells the range is the whole tab, which Sheets trims to its used area.
+    """
+    quoted_name = "'" + sheet_name.replace("'", "''") + "'"
+    return f"{quoted_name}!{cells}" if cells else quoted_name
+
+
+def _column_letters(n):
     string = ""
     while n > 0:
         n, remainder = divmod(n - 1, 26)
@@ -91,6 +288,316 @@ def column_number_to_letter(n):
     return string
 
 
+# Letters for columns A..ZZ, which covers every realistic session column
+_COL_LETTERS = tuple(_column_letters(n) for n in range(1, 703))
+
+
+def column_number_to_letter(n):
+    """Convert column number to letter (1='A', 2='B', etc.)"""
+    if 0 < n <= len(_COL_LETTERS):
+        return _COL_LETTERS[n - 1]
+    return _column_letters(n)
+
+
+def _question_key(question_number) -> str:
+    """Normalize a question number so "1", 1 and " 1 " all name the same question"""
+    return str(question_number).strip()
+
+
+def _cache_questions(sheet_id: str, sheet_name: str, values: list) -> Dict[str, Tuple[int, str]]:
+    """Memoize the row and text of each question of a sheet from values starting at column A"""
+    questions = {}
+    add_question = questions.setdefault  # first occurrence of a question number wins
+    for i, row in enumerate(values, start=1):
+        if row:
+            add_question(_question_key(row[0]), (i, row[1] if len(row) > 1 else ""))
+    _question_cache[(sheet_id, sheet_name)] = questions
+    return questions
+
+
+async def _read_grid_ids(sheet_id: str) -> Dict[str, int]:
+    """Read and cache the numeric sheetId of every tab of a spreadsheet"""
+    result = await _with_backoff(get_sheets_service().spreadsheets().get(
+        spreadsheetId=sheet_id,
+        fields='sheets.properties(sheetId,title)'
+    ))
+    grid_ids = _grid_ids[sheet_id] = {
+        sheet['properties']['title']: sheet['properties']['sheetId']
+        for sheet in result.get('sheets', [])
+    }
+    return grid_ids
+
+
+async def _grid_id(sheet_id: str, sheet_name: str) -> int:
+    """
+    Return the numeric sheetId of a tab, re-reading the tab list only when the tab is unknown
+
+    Concurrent callers share one in-flight read, so a burst of saves on a cold
+    cache costs a single spreadsheets.get and still lands in one flush.
+    """
+    grid_ids = _grid_ids.get(sheet_id)
+    if grid_ids is None or sheet_name not in grid_ids:
+        lookup = _grid_id_lookups.get(sheet_id)
+        if lookup is None:
+            lookup = _grid_id_lookups[sheet_id] = asyncio.ensure_future(_read_grid_ids(sheet_id))
+            lookup.add_done_callback(
+                lambda done: _grid_id_lookups.pop(sheet_id, None) if _grid_id_lookups.get(sheet_id) is done else None
+            )
+        # Shielded so one caller being cancelled doesn't cancel the read for the others
+        grid_ids = await asyncio.shield(lookup)
+    if sheet_name not in grid_ids:
+        raise ValueError(f"Sheet tab '{sheet_name}' not found")
+    return grid_ids[sheet_name]
+
+
+def _cell_value(value) -> dict:
+    """Build the userEnteredValue of a cell the way valueInputOption RAW stores it"""
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, (int, float)):
+        return {'numberValue': value}
+    return {'stringValue': str(value)}
+
+
+async def _update_cells(sheet_id: str, writes: list) -> dict:
+    """Send queued cell writes to one spreadsheet as a single spreadsheets.batchUpdate"""
+    # Later writes to the same cell win
+    data = {(grid_id, row, col): value for (_, grid_id, row, col), value, _ in writes}
+    # updateCells addresses cells by numeric GridCoordinate, so the API
+    # has no A1 ranges to parse
+    return await _with_backoff(get_sheets_service().spreadsheets().batchUpdate(
+        spreadsheetId=sheet_id,
+        body={
+            'requests': [
+                {
+                    'updateCells': {
+                        'start': {
+                            'sheetId': grid_id,
+                            'rowIndex': row - 1,
+                            'columnIndex': col - 1
+                        },
+                        'rows': [{'values': [{'userEnteredValue': _cell_value(value)}]}],
+                        'fields': 'userEnteredValue'
+                    }
+                }
+                for (grid_id, row, col), value in data.items()
+            ]
+        }
+    ))
+
+
+def _settle_writes(writes: list, result=None, error: Optional[Exception] = None) -> None:
+    """Resolve the futures of flushed writes with the batch result or its error"""
+    for _, _, future in writes:
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+async def _flush_sheet_writes(sheet_id: str, writes: list) -> None:
+    """Flush one spreadsheet's queued cell writes, retrying once if a tab's sheetId went stale"""
+    try:
+        result = await _update_cells(sheet_id, writes)
+    except HttpError as e:
+        # A tab deleted and recreated under the same name has a new sheetId;
+        # re-read the tab list and retry once if any tab changed ID or disappeared
+        _grid_ids.pop(sheet_id, None)
+        sheet_names = {cell[0] for cell, _, _ in writes}
+        new_ids = {}
+        for sheet_name in sheet_names:
+            try:
+                new_ids[sheet_name] = await _grid_id(sheet_id, sheet_name)
+            except Exception as lookup_error:
+                _settle_writes([w for w in writes if w[0][0] == sheet_name], error=lookup_error)
+
+        retry = [
+            ((sheet_name, new_ids[sheet_name], row, col), value, future)
+            for (sheet_name, _, row, col), value, future in writes
+            if sheet_name in new_ids
+        ]
+        if len(new_ids) == len(sheet_names) and all(
+            new_ids[sheet_name] == grid_id for (sheet_name, grid_id, _, _), _, _ in writes
+        ):
+            _settle_writes(retry, error=e)
+            return
+        try:
+            result = await _update_cells(sheet_id, retry)
+        except Exception as retry_error:
+            _settle_writes(retry, error=retry_error)
+        else:
+            _settle_writes(retry, result)
+    except Exception as e:
+        _settle_writes(writes, error=e)
+    else:
+        _settle_writes(writes, result)
+
+
+async def _flush_writes(batch: list) -> None:
+    """Send queued cell writes, one concurrent batchUpdate per spreadsheet"""
+    writes_by_sheet = {}
+    for sheet_id, cell, value, future in batch:
+        writes_by_sheet.setdefault(sheet_id, []).append((cell, value, future))
+
+    await asyncio.gather(*(
+        _flush_sheet_writes(sheet_id, writes)
+        for sheet_id, writes in writes_by_sheet.items()
+    ))
+
+
+async def _flush_loop() -> None:
+    """Drain the write queue every FLUSH_MS, or as soon as FLUSH_BATCH writes are pending"""
+    while True:
+        await _flush_event.wait()
+        try:
+            await asyncio.wait_for(_batch_full_event.wait(), timeout=FLUSH_MS / 1000)
+        except asyncio.TimeoutError:
+            pass
+        _flush_event.clear()
+        _batch_full_event.clear()
+
+        batch = _pending_writes[:]
+        _pending_writes.clear()
+        await _flush_writes(batch)
+
+
+async def _queue_write(sheet_name: str, row: int, col: int, value: str) -> dict:
+    """Queue a single cell write (1-based row and column) and wait until its batch has been flushed"""
+    global _flush_task
+
+    sheet_id = GOOGLE_SHEET_ID
+    future = asyncio.get_running_loop().create_future()
+    unflushed = _unflushed_writes[(sheet_id, sheet_name)]
+    unflushed.add(future)
+    future.add_done_callback(unflushed.discard)
+
+    # Resolved here so an unknown tab fails only this caller, not the whole batch
+    try:
+        grid_id = await _grid_id(sheet_id, sheet_name)
+    except BaseException:
+        future.cancel()
+        raise
+
+    _pending_writes.append((sheet_id, (sheet_name, grid_id, row, col), value, future))
+
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_loop())
+    _flush_event.set()
+    if len(_pending_writes) >= FLUSH_BATCH:
+        _batch_full_event.set()
+
+    return await future
+
+
+async def _sheet_snapshot(sheet_id: str, sheet_name: str, fresh: bool = False) -> list:
+    """
+    Return the values of a sheet's used range, re-reading them at most every SNAPSHOT_TTL seconds
+
+    fetch_questions, start_new_session, get_all_responses and the question
+    cache all derive their views from this one read. Writes drop the snapshot of the sheet
+    they touch, so callers always see their own changes. With fresh=True the
+    sheet is always re-read (and the result cached for everyone else).
+    """
+    cache_key = (sheet_id, sheet_name)
+    cached = _snapshot_cache.get(cache_key)
+    if not fresh and cached is not None and time.monotonic() - cached[0] < SNAPSHOT_TTL:
+        return cached[1]
+
+    generation = _snapshot_generations.get(cache_key, 0)
+    result = await _with_backoff(_sheet_values().get(
+        spreadsheetId=sheet_id,
+        range=_a1_range(sheet_name),
+        valueRenderOption='UNFORMATTED_VALUE',
+        dateTimeRenderOption='SERIAL_NUMBER',
+        fields='values',
+        prettyPrint=False
+    ))
+    values = result.get('values', [])
+    if _snapshot_generations.get(cache_key, 0) != generation:
+        # The sheet was written while this read was in flight; don't cache it
+        return values
+
+    # Re-insert so dict order tracks recency, then evict the least recently fetched
+    _snapshot_cache.pop(cache_key, None)
+    _snapshot_cache[cache_key] = (time.monotonic(), values)
+    if len(_snapshot_cache) > SNAPSHOT_CACHE_SIZE:
+        del _snapshot_cache[next(iter(_snapshot_cache))]
+    return values
+
+
+def _drop_snapshot(sheet_id: str, sheet_name: str) -> None:
+    """Invalidate a sheet's snapshot after a write, including any read still in flight"""
+    cache_key = (sheet_id, sheet_name)
+    _snapshot_cache.pop(cache_key, None)
+    _snapshot_generations[cache_key] = _snapshot_generations.get(cache_key, 0) + 1
+
+
+async def _get_cached_questions(sheet_name: str, question_number: Optional[str] = None) -> Dict[str, Tuple[int, str]]:
+    """
+    Return the cached questions of a sheet
+
+    The questions are rebuilt from the sheet snapshot only when the sheet
+    isn't cached yet or when question_number is given and missing from the
+    cache, so repeated misses cost at most one read per SNAPSHOT_TTL.
+    """
+    async with _question_cache_lock:
+        questions = _question_cache.get((GOOGLE_SHEET_ID, sheet_name))
+        if questions is None or (question_number is not None and _question_key(question_number) not in questions):
+            values = await _sheet_snapshot(GOOGLE_SHEET_ID, sheet_name)
+            questions = _cache_questions(GOOGLE_SHEET_ID, sheet_name, values)
+        return questions
+
+
+def _save_session_cache() -> None:
+    """Write the current sessions to SESSION_CACHE_FILE"""
+    state = {
+        "sessions": [
+            {"sheet_id": GOOGLE_SHEET_ID, "sheet_name": sheet_name, **session}
+            for sheet_name, session in current_sessions.items()
+        ],
+    }
+    try:
+        os.makedirs(os.path.dirname(SESSION_CACHE_FILE), exist_ok=True)
+        tmp_file = SESSION_CACHE_FILE + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(state))
+        os.replace(tmp_file, SESSION_CACHE_FILE)
+    except OSError as e:
+        print(f"[WARNING] Could not save session cache: {e}")
+
+
+def _load_session_cache() -> None:
+    """
+    Restore the sessions saved by a previous run
+
+    Only sessions for the current GOOGLE_SHEET_ID are restored. Question rows
+    are not persisted: the organizer may have added or reordered questions
+    while the server was down, so the index is rebuilt from the first read.
+    """
+    try:
+        with open(SESSION_CACHE_FILE, "rb") as f:
+            state = orjson.loads(f.read())
+    except FileNotFoundError:
+        return
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"[WARNING] Ignoring unreadable session cache: {e}")
+        return
+
+    # Build everything first so a malformed file restores nothing rather than half
+    try:
+        sessions = {
+            entry["sheet_name"]: {"col": int(entry["col"]), "col_letter": str(entry["col_letter"])}
+            for entry in state.get("sessions", [])
+            if entry.get("sheet_id") == GOOGLE_SHEET_ID
+        }
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        print(f"[WARNING] Ignoring malformed session cache: {e!r}")
+        return
+
+    current_sessions.update(sessions)
+
+
 # ---------------- FETCH QUESTIONS ----------------
 async def _fetch_questions_impl(sheet_name: str = "Sheet1") -> dict:
     """
@@ -105,16 +612,10 @@ async def _fetch_questions_impl(sheet_name: str = "Sheet1") -> dict:
         Dictionary containing list of questions with their numbers
     """
     try:
-        service = get_sheets_service()
-
-        # Read questions from columns A and B
-        range_name = f"{sheet_name}!A:B"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=range_name
-        ).execute()
+        sheet_id = GOOGLE_SHEET_ID
 
-        values = result.get('values', [])
+        # Questions are columns A and B of the sheet snapshot
+        values = await _sheet_snapshot(sheet_id, sheet_name)
 
         if not values:
             return {
@@ -122,18 +623,17 @@ async def _fetch_questions_impl(sheet_name: str = "Sheet1") -> dict:
                 "message": "No questions found in the sheet"
             }
 
-        questions = []
-        for i, row in enumerate(values, start=1):
-            if len(row) >= 2:
-                questions.append({
-                    "row": i,
-                    "question_number": row[0],
-                    "question_text": row[1]
-                })
+        _cache_questions(sheet_id, sheet_name, values)
+
+        questions = [
+            {"row": i, "question_number": _question_key(row[0]), "question_text": row[1]}
+            for i, row in enumerate(values, start=1)
+            if len(row) >= 2
+        ]
 
         return {
             "status": "success",
-            "sheet_id": GOOGLE_SHEET_ID,
+            "sheet_id": sheet_id,
             "sheet_name": sheet_name,
             "total_questions": len(questions),
             "questions": questions
@@ -166,17 +666,23 @@ async def _start_new_session_impl(sheet_name: str = "Sheet1") -> dict:
     Returns:
         Dictionary with session information
     """
+    async with _sheet_locks[sheet_name]:
+        return await _begin_session(sheet_name)
+
+
+async def _begin_session(sheet_name: str) -> dict:
+    """Start a new session on a sheet; the caller must hold _sheet_locks[sheet_name]"""
     try:
-        service = get_sheets_service()
+        sheet_id = GOOGLE_SHEET_ID
 
-        # Get all data to find the next empty column
-        range_name = f"{sheet_name}!A:ZZ"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=range_name
-        ).execute()
+        # Let queued saves to this sheet land first, so their column counts as used
+        unflushed = _unflushed_writes.get((sheet_id, sheet_name))
+        if unflushed:
+            await asyncio.wait(list(unflushed))
 
-        values = result.get('values', [])
+        # Get all data to find the next empty column; always a fresh read, since
+        # sizing from a stale snapshot would reuse a column that holds answers
+        values = await _sheet_snapshot(sheet_id, sheet_name, fresh=True)
 
         if not values:
             return {
@@ -184,8 +690,14 @@ async def _start_new_session_impl(sheet_name: str = "Sheet1") -> dict:
                 "message": "No data found in the sheet"
             }
 
-        # Find the maximum column used (should be at least column B for questions)
-        max_cols = max(len(row) for row in values) if values else 2
+        # Columns A:B of this read also index the questions, so a save that
+        # auto-started this session doesn't need a read of its own
+        _cache_questions(sheet_id, sheet_name, values)
+
+        # Find the maximum column used (should be at least column B for questions).
+        # Every row counts, not just row 1 - a session that skipped question 1
+        # still owns its column.
+        max_cols = max(map(len, values))
 
         # Next available column is max_cols + 1
         # If max_cols is 2 (just A and B), next session is column C (index 3)
@@ -194,7 +706,7 @@ async def _start_new_session_impl(sheet_name: str = "Sheet1") -> dict:
         session_number = next_col_index - 2  # Column C = Session 1, D = Session 2, etc.
 
         # Store the current session for this sheet
-        current_sessions[sheet_name] = next_col_index
+        current_sessions[sheet_name] = {'col': next_col_index, 'col_letter': next_col_letter}
 
         return {
             "status": "success",
@@ -240,63 +752,50 @@ async def _save_response_impl(
     Returns:
         Dictionary with success status and details
     """
-    try:
-        service = get_sheets_service()
+    if question_number is None or response is None:
+        return {
+            "status": "error",
+            "message": "Both question_number and response are required"
+        }
 
-        # Check if a session has been started
-        if sheet_name not in current_sessions:
-            # Auto-start a new session if not already started
-            session_result = await _start_new_session_impl(sheet_name)
-            if session_result.get('status') == 'error':
-                return session_result
-
-        # Get the current session column for this sheet
-        session_col_index = current_sessions[sheet_name]
-        session_col_letter = column_number_to_letter(session_col_index)
-
-        # Find the row for this question_number
-        range_name = f"{sheet_name}!A:A"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=range_name
-        ).execute()
-
-        values = result.get('values', [])
-        question_row = None
-
-        for i, row in enumerate(values, start=1):
-            if row and str(row[0]) == str(question_number):
-                question_row = i
-                break
-
-        if question_row is None:
+    # Reject blank question numbers before they can cost a session start or a refresh
+    question_number = _question_key(question_number)
+    if not question_number:
+        return {
+            "status": "error",
+            "message": "question_number must not be empty"
+        }
+
+    try:
+        async with _sheet_locks[sheet_name]:
+            # Check if a session has been started; under the lock, concurrent
+            # first saves share one auto-started session
+            if sheet_name not in current_sessions:
+                # Auto-start a new session if not already started
+                session_result = await _begin_session(sheet_name)
+                if session_result.get('status') == 'error':
+                    return session_result
+
+            # Get the current session column for this sheet
+            session = current_sessions[sheet_name]
+        session_col_index = session['col']
+        session_col_letter = session['col_letter']
+
+        # Find the row and text for this question_number
+        questions = await _get_cached_questions(sheet_name, question_number)
+
+        if question_number not in questions:
             return {
                 "status": "error",
                 "message": f"Question number '{question_number}' not found in sheet"
             }
 
-        # Get the question text
-        row_range = f"{sheet_name}!B{question_row}"
-        row_result = service.spreadsheets().values().get(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=row_range
-        ).execute()
-
-        row_data = row_result.get('values', [[]])[0]
-        question_text = row_data[0] if len(row_data) > 0 else ""
+        question_row, question_text = questions[question_number]
 
         # Write response to the CURRENT SESSION column
-        cell_range = f"{sheet_name}!{session_col_letter}{question_row}"
-        response_body = {
-            'values': [[response]]
-        }
-
-        service.spreadsheets().values().update(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=cell_range,
-            valueInputOption='RAW',
-            body=response_body
-        ).execute()
+        # (queued so that concurrent saves share a single batchUpdate)
+        await _queue_write(sheet_name, question_row, session_col_index, response)
+        _drop_snapshot(GOOGLE_SHEET_ID, sheet_name)
 
         return {
             "status": "success",
@@ -325,8 +824,104 @@ async def save_response(
     return await _save_response_impl(question_number, response, sheet_name)
 
 
+# ---------------- SAVE RESPONSES (BATCH) ----------------
+async def _save_responses_batch_impl(
+    responses: List[Dict[str, str]],
+    sheet_name: str = "Sheet1"
+) -> dict:
+    """
+    Save several responses to the current session column in one write
+
+    Behavior:
+    - Same as save_response, but every answer goes out in a single
+      batchUpdate (one API request regardless of how many answers)
+    - Nothing is written if any question_number is not found
+
+    Args:
+        responses: List of {"question_number": ..., "response": ...} items
+        sheet_name: Name of the sheet tab (default: "Sheet1")
+
+    Returns:
+        Dictionary with success status and the saved responses
+    """
+    if not isinstance(responses, list) or not responses or not all(
+        isinstance(item, dict) and item.get('question_number') is not None and item.get('response') is not None
+        and _question_key(item['question_number'])
+        for item in responses
+    ):
+        return {
+            "status": "error",
+            "message": "responses must be a non-empty list of {question_number, response} items"
+        }
+    numbers = [_question_key(item['question_number']) for item in responses]
+
+    try:
+        async with _sheet_locks[sheet_name]:
+            # Check if a session has been started; under the lock, concurrent
+            # first saves share one auto-started session
+            if sheet_name not in current_sessions:
+                # Auto-start a new session if not already started
+                session_result = await _begin_session(sheet_name)
+                if session_result.get('status') == 'error':
+                    return session_result
+
+            # Get the current session column for this sheet
+            session = current_sessions[sheet_name]
+        session_col_index = session['col']
+        session_col_letter = session['col_letter']
+
+        # Resolve every question up front; one refresh covers all cache misses
+        questions = await _get_cached_questions(sheet_name)
+        missing = [number for number in numbers if number not in questions]
+        if missing:
+            questions = await _get_cached_questions(sheet_name, missing[0])
+            missing = [number for number in missing if number not in questions]
+        if missing:
+            return {
+                "status": "error",
+                "message": f"Question numbers not found in sheet: {', '.join(missing)}"
+            }
+
+        # Queued together, so they are flushed as one batchUpdate
+        await asyncio.gather(*(
+            _queue_write(sheet_name, questions[number][0], session_col_index, item['response'])
+            for number, item in zip(numbers, responses)
+        ))
+        _drop_snapshot(GOOGLE_SHEET_ID, sheet_name)
+
+        return {
+            "status": "success",
+            "saved": [
+                {
+                    "question_number": number,
+                    "question_text": questions[number][1],
+                    "response": item['response']
+                }
+                for number, item in zip(numbers, responses)
+            ],
+            "column": session_col_letter,
+            "session_column": session_col_index - 2,
+            "message": f"Saved {len(responses)} responses in column {session_col_letter} (Session {session_col_index - 2})"
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to save responses: {str(e)}"
+        }
+
+
+@mcp.tool
+async def save_responses_batch(
+    responses: List[Dict[str, str]],
+    sheet_name: str = "Sheet1"
+) -> dict:
+    """MCP tool wrapper for save_responses_batch"""
+    return await _save_responses_batch_impl(responses, sheet_name)
+
+
 # ---------------- GET ALL RESPONSES ----------------
-async def _get_all_responses_impl(sheet_name: str = "Sheet1") -> dict:
+async def _get_all_responses_impl(sheet_name: str = "Sheet1", layout: str = "rows") -> dict:
     """
     Retrieve all questions and their responses from the Google Sheet
 
@@ -334,21 +929,24 @@ async def _get_all_responses_impl(sheet_name: str = "Sheet1") -> dict:
 
     Args:
         sheet_name: Name of the sheet tab (default: "Sheet1")
+        layout: "rows" for one entry per question with its non-empty responses
+            (default), or "columns" for parallel question_numbers/question_texts
+            lists plus a response_matrix of every session cell per question
 
     Returns:
         Dictionary containing all questions with their responses across all sessions
     """
+    if layout not in ("rows", "columns"):
+        return {
+            "status": "error",
+            "message": "layout must be 'rows' or 'columns'"
+        }
+
     try:
-        service = get_sheets_service()
+        sheet_id = GOOGLE_SHEET_ID
 
         # Read all data from the sheet
-        range_name = f"{sheet_name}!A:ZZ"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=range_name
-        ).execute()
-
-        values = result.get('values', [])
+        values = await _sheet_snapshot(sheet_id, sheet_name)
 
         if not values:
             return {
@@ -356,31 +954,41 @@ async def _get_all_responses_impl(sheet_name: str = "Sheet1") -> dict:
                 "message": "No data found in the sheet"
             }
 
-        # Determine number of sessions (columns C onwards that have data)
-        max_cols = max(len(row) for row in values) if values else 0
+        # Number of sessions = columns C onwards that have data
+        max_cols = max(map(len, values))
         num_sessions = max(0, max_cols - 2)  # Subtract columns A and B
 
-        responses = []
-        for row in values:
-            question_data = {
-                "question_number": row[0] if len(row) > 0 else "",
-                "question_text": row[1] if len(row) > 1 else "",
-                "responses": []
+        if layout == "columns":
+            # A few flat lists instead of a dict per question and per response
+            return {
+                "status": "success",
+                "sheet_id": sheet_id,
+                "sheet_name": sheet_name,
+                "total_questions": len(values),
+                "total_sessions": num_sessions,
+                "question_numbers": [_question_key(row[0]) if row else "" for row in values],
+                "question_texts": [row[1] if len(row) > 1 else "" for row in values],
+                "response_matrix": [(row[2:] + [""] * num_sessions)[:num_sessions] for row in values]
             }
 
-            # Collect all session responses for this question
-            for i in range(2, len(row)):
-                if row[i]:  # Only include non-empty responses
-                    question_data["responses"].append({
-                        "session": i - 1,  # Session 1, 2, 3, etc.
-                        "response": row[i]
-                    })
-
-            responses.append(question_data)
+        responses = [
+            {
+                # Unformatted numbers come back as JSON numbers; keep question numbers as strings
+                "question_number": _question_key(row[0]) if row else "",
+                "question_text": row[1] if len(row) > 1 else "",
+                # Non-empty session responses; column C = Session 1, D = Session 2, etc.
+                "responses": [
+                    {"session": session, "response": cell}
+                    for session, cell in enumerate(row[2:], start=1)
+                    if cell != ""
+                ]
+            }
+            for row in values
+        ]
 
         return {
             "status": "success",
-            "sheet_id": GOOGLE_SHEET_ID,
+            "sheet_id": sheet_id,
             "sheet_name": sheet_name,
             "total_questions": len(responses),
             "total_sessions": num_sessions,
@@ -395,18 +1003,25 @@ async def _get_all_responses_impl(sheet_name: str = "Sheet1") -> dict:
 
 
 @mcp.tool
-async def get_all_responses(sheet_name: str = "Sheet1") -> dict:
+async def get_all_responses(sheet_name: str = "Sheet1", layout: str = "rows") -> dict:
     """MCP tool wrapper for get_all_responses"""
-    return await _get_all_responses_impl(sheet_name)
+    return await _get_all_responses_impl(sheet_name, layout)
 
 
 # ---------------- CLEAR SESSION RESPONSES ----------------
-async def _clear_session_responses_impl(session_number: int, sheet_name: str = "Sheet1", confirm: bool = False) -> dict:
+async def _clear_session_responses_impl(
+    session_number: Union[int, List[int]],
+    sheet_name: str = "Sheet1",
+    confirm: bool = False
+) -> dict:
     """
-    Clear responses from a specific session column
+    Clear responses from one or more session columns
+
+    All columns are cleared with a single batchClear request.
 
     Args:
-        session_number: Session number to clear (1 = Column C, 2 = Column D, etc.)
+        session_number: Session number to clear (1 = Column C, 2 = Column D, etc.),
+            or a list of session numbers
         sheet_name: Name of the sheet tab (default: "Sheet1")
         confirm: Must be set to True to actually clear responses (safety feature)
 
@@ -419,42 +1034,59 @@ async def _clear_session_responses_impl(session_number: int, sheet_name: str = "
             "message": "Please set confirm=True to clear session responses. This action cannot be undone."
         }
 
-    try:
-        service = get_sheets_service()
-
-        # Calculate column letter (Session 1 = Column C = index 3)
-        col_index = session_number + 2
-        col_letter = column_number_to_letter(col_index)
-
-        # Get number of rows
-        range_name = f"{sheet_name}!A:A"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=range_name
-        ).execute()
-
-        values = result.get('values', [])
-        num_rows = len(values)
+    # Accept ints and numeric strings (HTTP bodies often carry "1"), but not bools
+    session_numbers = [
+        int(number.strip()) if isinstance(number, str) and number.strip().isdecimal()
+        else number if isinstance(number, int) and not isinstance(number, bool)
+        else None
+        for number in (session_number if isinstance(session_number, list) else [session_number])
+    ]
+    if not session_numbers or None in session_numbers:
+        return {
+            "status": "error",
+            "message": f"Invalid session_number '{session_number}': must be an integer or a list of integers"
+        }
+    if min(session_numbers) < 1:
+        return {
+            "status": "error",
+            "message": f"Invalid session_number '{session_number}': expected 1 or greater"
+        }
+    single_session = None if isinstance(session_number, list) else session_numbers[0]
+    session_numbers = sorted(set(session_numbers))
 
-        if num_rows == 0:
+    try:
+        # Calculate column letters (Session 1 = Column C = index 3)
+        col_letters = [column_number_to_letter(number + 2) for number in session_numbers]
+
+        # Held until the snapshot is dropped, so a session start on this sheet
+        # can't size its column from pre-clear data
+        async with _sheet_locks[sheet_name]:
+            # Clear the entire column for each session; whole-column ranges need
+            # no row count, so rows added after the last read are cleared too
+            clear_ranges = [_a1_range(sheet_name, f"{col_letter}:{col_letter}") for col_letter in col_letters]
+
+            await _with_backoff(_sheet_values().batchClear(
+                spreadsheetId=GOOGLE_SHEET_ID,
+                body={'ranges': clear_ranges}
+            ))
+            _drop_snapshot(GOOGLE_SHEET_ID, sheet_name)
+
+        if single_session is not None:
             return {
-                "status": "error",
-                "message": "No data found in sheet"
+                "status": "success",
+                "message": f"Cleared session {single_session} responses (Column {col_letters[0]})",
+                "session_number": single_session,
+                "column_cleared": col_letters[0]
             }
 
-        # Clear the entire column for that session
-        clear_range = f"{sheet_name}!{col_letter}1:{col_letter}{num_rows}"
-
-        service.spreadsheets().values().clear(
-            spreadsheetId=GOOGLE_SHEET_ID,
-            range=clear_range
-        ).execute()
-
         return {
             "status": "success",
-            "message": f"Cleared session {session_number} responses (Column {col_letter})",
-            "session_number": session_number,
-            "column_cleared": col_letter
+            "message": (
+                f"Cleared sessions {', '.join(map(str, session_numbers))} responses "
+                f"(Columns {', '.join(col_letters)})"
+            ),
+            "session_numbers": session_numbers,
+            "columns_cleared": col_letters
         }
 
     except Exception as e:
@@ -465,7 +1097,11 @@ async def _clear_session_responses_impl(session_number: int, sheet_name: str = "
 
 
 @mcp.tool
-async def clear_session_responses(session_number: int, sheet_name: str = "Sheet1", confirm: bool = False) -> dict:
+async def clear_session_responses(
+    session_number: Union[int, List[int]],
+    sheet_name: str = "Sheet1",
+    confirm: bool = False
+) -> dict:
     """MCP tool wrapper for clear_session_responses"""
     return await _clear_session_responses_impl(session_number, sheet_name, confirm)
 
@@ -483,22 +1119,43 @@ async def _update_sheet_id_impl(new_sheet_id: str) -> dict:
     """
     global GOOGLE_SHEET_ID
 
+    if not new_sheet_id:
+        return {
+            "status": "error",
+            "message": "new_sheet_id is required"
+        }
+
     try:
         # Validate the new sheet ID by trying to access it
         service = get_sheets_service()
 
-        # Try to get sheet metadata
-        service.spreadsheets().get(spreadsheetId=new_sheet_id).execute()
+        async with _sheet_id_lock:
+            # Try to get sheet metadata - just the title and tab IDs, never grid data
+            metadata = await _with_backoff(service.spreadsheets().get(
+                spreadsheetId=new_sheet_id,
+                fields='spreadsheetId,properties.title,sheets.properties(sheetId,title)'
+            ))
+            # The tab IDs are what the first save would otherwise fetch
+            _grid_ids[new_sheet_id] = {
+                sheet['properties']['title']: sheet['properties']['sheetId']
+                for sheet in metadata.get('sheets', [])
+            }
 
-        # If successful, update the global variable
-        old_sheet_id = GOOGLE_SHEET_ID
-        GOOGLE_SHEET_ID = new_sheet_id
+            # If successful, update the global variable and drop state tied to the old sheet
+            # (waiting for any in-flight question refresh so it can't repopulate stale data)
+            async with _question_cache_lock:
+                old_sheet_id = GOOGLE_SHEET_ID
+                GOOGLE_SHEET_ID = new_sheet_id
+                _question_cache.clear()
+                _snapshot_cache.clear()
+                current_sessions.clear()
 
         return {
             "status": "success",
             "message": "Sheet ID updated successfully",
             "old_sheet_id": old_sheet_id,
-            "new_sheet_id": new_sheet_id
+            "new_sheet_id": new_sheet_id,
+            "sheet_title": metadata.get('properties', {}).get('title', "")
         }
 
     except Exception as e:
@@ -519,60 +1176,78 @@ from starlette.responses import JSONResponse
 from starlette.requests import Request
 
 
-@mcp.custom_route('/tools/fetch_questions', methods=['POST'])
-async def http_fetch_questions(request: Request):
-    """HTTP endpoint for fetch_questions"""
-    body = await request.json()
-    result = await _fetch_questions_impl(body.get('sheet_name', 'Sheet1'))
-    return JSONResponse(result)
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson instead of the stdlib json module"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
 
 
-@mcp.custom_route('/tools/start_new_session', methods=['POST'])
-async def http_start_new_session(request: Request):
-    """HTTP endpoint for start_new_session"""
-    body = await request.json()
-    result = await _start_new_session_impl(body.get('sheet_name', 'Sheet1'))
-    return JSONResponse(result)
+async def _read_json(request: Request) -> dict:
+    """Decode a request body with orjson, treating an empty body as {}"""
+    raw = await request.body()
+    return orjson.loads(raw) if raw else {}
 
 
-@mcp.custom_route('/tools/save_response', methods=['POST'])
-async def http_save_response(request: Request):
-    """HTTP endpoint for save_response"""
-    body = await request.json()
-    result = await _save_response_impl(
-        question_number=body.get('question_number'),
-        response=body.get('response'),
+@mcp.custom_route('/tools/batch', methods=['POST'])
+async def http_batch(request: Request):
+    """
+    HTTP endpoint that runs a list of operations in one request
+
+    Body: {"sheet_name": "Sheet1", "operations": [{"op": "save_response",
+    "question_number": "1", "response": "..."}, ...]}. All save_response
+    operations are fused into one save_responses_batch write.
+    """
+    body = await _read_json(request)
+    operations = body.get('operations')
+    if not isinstance(operations, list) or not all(
+        isinstance(op, dict) and op.get('op') == 'save_response' for op in operations
+    ):
+        return ORJSONResponse({
+            "status": "error",
+            "message": "operations must be a list of {op: 'save_response', question_number, response} items"
+        })
+    result = await _save_responses_batch_impl(
+        responses=operations,
         sheet_name=body.get('sheet_name', 'Sheet1')
     )
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
-@mcp.custom_route('/tools/get_all_responses', methods=['POST'])
-async def http_get_all_responses(request: Request):
-    """HTTP endpoint for get_all_responses"""
-    body = await request.json()
-    result = await _get_all_responses_impl(body.get('sheet_name', 'Sheet1'))
-    return JSONResponse(result)
+# Implementations reachable as POST /tools/<name>; the JSON body supplies their arguments
+_TOOL_IMPLS = {
+    'fetch_questions': _fetch_questions_impl,
+    'start_new_session': _start_new_session_impl,
+    'save_response': _save_response_impl,
+    'save_responses_batch': _save_responses_batch_impl,
+    'get_all_responses': _get_all_responses_impl,
+    'clear_session_responses': _clear_session_responses_impl,
+    'update_sheet_id': _update_sheet_id_impl,
+}
+_TOOL_PARAMS = {name: inspect.signature(impl).parameters for name, impl in _TOOL_IMPLS.items()}
 
 
-@mcp.custom_route('/tools/clear_session_responses', methods=['POST'])
-async def http_clear_session_responses(request: Request):
-    """HTTP endpoint for clear_session_responses"""
-    body = await request.json()
-    result = await _clear_session_responses_impl(
-        session_number=body.get('session_number'),
-        sheet_name=body.get('sheet_name', 'Sheet1'),
-        confirm=body.get('confirm', False)
-    )
-    return JSONResponse(result)
+@mcp.custom_route('/tools/{tool_name}', methods=['POST'])
+async def http_tool(request: Request):
+    """
+    HTTP endpoint for every tool in _TOOL_IMPLS
 
+    Body keys matching the tool's parameters are passed through; optional
+    ones fall back to their defaults and missing required ones arrive as
+    None, which each tool rejects with an error result.
+    """
+    tool_name = request.path_params['tool_name']
+    impl = _TOOL_IMPLS.get(tool_name)
+    if impl is None:
+        return ORJSONResponse({"status": "error", "message": f"Unknown tool: {tool_name}"}, status_code=404)
 
-@mcp.custom_route('/tools/update_sheet_id', methods=['POST'])
-async def http_update_sheet_id(request: Request):
-    """HTTP endpoint for update_sheet_id"""
-    body = await request.json()
-    result = await _update_sheet_id_impl(body.get('new_sheet_id'))
-    return JSONResponse(result)
+    body = await _read_json(request)
+    kwargs = {
+        name: body.get(name)
+        for name, param in _TOOL_PARAMS[tool_name].items()
+        if name in body or param.default is param.empty
+    }
+    return ORJSONResponse(await impl(**kwargs))
 
 
 # ---------------- RUN MCP SERVER ----------------
@@ -587,7 +1262,18 @@ if __name__ == "__main__":
     else:
         print(f"[INFO] Sheet ID: {GOOGLE_SHEET_ID}")
 
-    print(f"[INFO] Credentials: {CREDENTIALS_FILE}")
+    print(f"[INFO] Credentials: {'GOOGLE_CREDENTIALS_JSON' if CREDENTIALS_JSON else CREDENTIALS_FILE}")
+
+    # Pick up sessions from the previous run, and save them again on exit
+    _load_session_cache()
+    atexit.register(_save_session_cache)
+
+    # Build the Sheets client up front so the first tool call doesn't pay for it
+    try:
+        get_sheets_service()
+    except Exception:
+        print("[WARNING] Sheets service will be initialized on first use")
+
     print(f"[INFO] Port: 8085")
     print(f"[INFO] HTTP Endpoints: /tools/fetch_questions, /tools/save_response, etc.")
     print("=" * 60)
@@ -28,6 +28,8 @@ export async function POST(request: NextRequest) {
       start_new_session: '/tools/start_new_session',
       fetch_questions: '/tools/fetch_questions',
       save_response: '/tools/save_response',
+      save_responses_batch: '/tools/save_responses_batch',
+      batch: '/tools/batch',
       get_all_responses: '/tools/get_all_responses',
       clear_all_responses: '/tools/clear_all_responses',
       clear_session_responses: '/tools/clear_session_responses',